@@ -6,7 +6,7 @@ Generates HTML character sheets and item cards from JSON data files.
 Supports PDF generation and compression via Chrome headless.
 
 Usage:
-    python3 generate.py <input.json> [options]
+    python3 generate.py <input.json> [<input.json> ...] [options]
 
 Options:
     --pdf           Generate PDF via Chrome headless
@@ -15,21 +15,34 @@ Options:
     --open          Open output files when done
     --output <dir>  Custom output directory
     --bundle        Include character's items in output (character + items)
+    --link-css      Link stylesheets from styles/ instead of inlining them
+    --minify        Strip indentation from the HTML and comments from inlined CSS
+    --jobs <n>      Worker processes when generating several files (default: CPU count)
+    --gzip          Gzip the timestamped HTML archive (.html.gz)
 """
 
 import argparse
-import json
 import os
+import re
 import shutil
 import subprocess
 import sys
-import tempfile
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Optional
 
 from lib import CharacterDocument, ItemDocument
 
+try:
+    import orjson as json  # Optional: faster JSON parsing
+except ImportError:
+    import json
+
+# Project folders, resolved once at import
+BASE_DIR = Path(__file__).parent
+CHARACTERS_DIR = BASE_DIR / "characters"
+OUTPUT_DIR = BASE_DIR / "output"
+
 
 # =============================================================================
 # PDF GENERATION & COMPRESSION
@@ -90,6 +103,8 @@ def compress_pdf(pdf_path: Path, output_path: Path, dpi: int = 150) -> bool:
         print("Error: img2pdf not found. Install img2pdf (brew install img2pdf)")
         return False
 
+    import tempfile  # Only needed for --compress
+
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -138,84 +153,147 @@ def open_file(path: Path) -> None:
         subprocess.run(["xdg-open", str(path)])
 
 
+# =============================================================================
+# HTML MINIFICATION
+# =============================================================================
+
+# A line break plus any surrounding indentation or blank lines
+LINE_BREAK_PATTERN = re.compile(r"[ \t]*\n\s*")
+
+
+def minify_html(html: str) -> str:
+    """Strip template indentation and blank lines, keeping one newline per break."""
+    return LINE_BREAK_PATTERN.sub("\n", html)
+
+
 # =============================================================================
 # DOCUMENT FACTORY
 # =============================================================================
 
-def create_document(data: dict, base_path: str = ""):
-    """Create appropriate document type based on data."""
-    doc_type = data.get("type", "character")
+def load_json(json_path: Path) -> dict:
+    """Load JSON data from file (uses orjson when installed)."""
+    return json.loads(json_path.read_bytes())
+
+
+# Document class per JSON "type"; anything else is treated as a character
+DOCUMENT_TYPES = {
+    "character": CharacterDocument,
+    "item": ItemDocument,
+}
 
-    if doc_type == "item":
-        return ItemDocument(data, base_path)
-    else:
-        return CharacterDocument(data, base_path)
+
+def create_document(data: dict, base_path: str = "", link_css: bool = False,
+                    minify: bool = False):
+    """Create appropriate document type based on data."""
+    document_class = DOCUMENT_TYPES.get(data.get("type", "character"), CharacterDocument)
+    return document_class(data, base_path, link_css, minify)
 
 
 # =============================================================================
 # GENERATION PIPELINE
 # =============================================================================
 
+# Timestamp suffix for archived output files
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H%M"
+
+# Spaces and characters not allowed in file names become underscores
+FILENAME_REPLACEMENTS = {char: "_" for char in ' /\\:*?"<>|'}
+FILENAME_TABLE = str.maketrans(FILENAME_REPLACEMENTS)
+
+# Item file names also drop apostrophes ("Hunter's Mark" -> "Hunters_Mark")
+ITEM_FILENAME_TABLE = str.maketrans(FILENAME_REPLACEMENTS | {"'": None})
+
+
+def output_location(data: dict, output_dir: Path) -> tuple[str, Path]:
+    """
+    Get the file-safe name and output folder for a document.
+
+    Items share output/items; each character gets a folder of its own.
+    """
+    header = data.get("header") or {}
+    if data.get("type", "character") == "item":
+        item_name = header.get("name") or "item"
+        return item_name.translate(ITEM_FILENAME_TABLE), output_dir / "items"
+
+    char_name = header.get("character_name") or "character"
+    safe_name = char_name.translate(FILENAME_TABLE)
+    return safe_name, output_dir / safe_name
+
+
+def write_archive(html_path: Path, html_bytes: bytes, gzip_output: bool = False) -> Path:
+    """
+    Write the timestamped HTML archive and return its path.
+
+    With gzip_output the archive is written compressed as .html.gz; the plain
+    "latest" copy is what Chrome and the browser open.
+    """
+    if gzip_output:
+        import gzip  # Only needed for --gzip
+        html_path = html_path.with_name(html_path.name + ".gz")
+        html_path.write_bytes(gzip.compress(html_bytes))
+    else:
+        html_path.write_bytes(html_bytes)
+    return html_path
+
+
 def generate(
     json_path: Path,
     output_dir: Optional[Path] = None,
     pdf: bool = False,
     compress: bool = False,
     dpi: int = 150,
-    open_files: bool = False
+    open_files: bool = False,
+    link_css: bool = False,
+    minify: bool = False,
+    gzip_output: bool = False,
+    timestamp: Optional[str] = None
 ) -> dict:
     """
     Unified generation pipeline for both characters and items.
 
+    timestamp names the archived files (default: now, in TIMESTAMP_FORMAT).
+
     Returns dict with paths to generated files:
         {"html": Path, "pdf": Path|None, "compressed": Path|None}
     """
-    base_dir = Path(__file__).parent
     if output_dir is None:
-        output_dir = base_dir / "output"
+        output_dir = OUTPUT_DIR
+    if timestamp is None:
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
 
     # Load JSON data
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(json_path)
 
-    doc_type = data.get("type", "character")
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
+    safe_name, doc_output_dir = output_location(data, output_dir)
 
     # Create document and generate HTML
-    if doc_type == "item":
-        base_path = "../.."  # Relative path from output/items to project root
-        document = ItemDocument(data, base_path)
-        item_name = data.get("header", {}).get("name", "item")
-        safe_name = item_name.replace(" ", "_").replace("'", "")
-        doc_output_dir = output_dir / "items"
-    else:
-        document = CharacterDocument(data)
-        char_name = data.get("header", {}).get("character_name", "character")
-        safe_name = char_name.replace(" ", "_")
-        doc_output_dir = output_dir / safe_name
+    base_path = "../.."  # Relative path from output/<folder> to project root (item images)
+    document = create_document(data, base_path, link_css, minify)
 
     # Generate HTML
     html = document.build_html()
+    if minify:
+        html = minify_html(html)
 
     # Ensure output directory exists
     doc_output_dir.mkdir(parents=True, exist_ok=True)
 
     # Write HTML
     html_path = doc_output_dir / f"{safe_name}_{timestamp}.html"
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    html_bytes = html.encode("utf-8")
+    html_path = write_archive(html_path, html_bytes, gzip_output)
 
     result = {"html": html_path, "pdf": None, "compressed": None}
     print(f"[HTML] {html_path}")
 
-    # Copy to stable "latest" filename
+    # Write the same bytes to stable "latest" filename
     latest_html = doc_output_dir / f"{safe_name}.html"
-    shutil.copy2(html_path, latest_html)
+    latest_html.write_bytes(html_bytes)
 
     # Generate PDF if requested
     if pdf or compress:
         pdf_path = doc_output_dir / f"{safe_name}_{timestamp}.pdf"
-        if generate_pdf(html_path, pdf_path):
+        if generate_pdf(latest_html, pdf_path):
             result["pdf"] = pdf_path
             print(f"[PDF]  {pdf_path} ({get_file_size(pdf_path)})")
 
@@ -232,7 +310,7 @@ def generate(
 
     # Open files if requested
     if open_files:
-        open_file(html_path)
+        open_file(latest_html)
         if result["compressed"]:
             open_file(result["compressed"])
         elif result["pdf"]:
@@ -241,23 +319,45 @@ def generate(
     return result
 
 
+def generate_batch(
+    json_paths: list[Path],
+    bundle: bool = False,
+    jobs: Optional[int] = None,
+    **options
+) -> list[dict]:
+    """
+    Run the generation pipeline for several files.
+
+    Each document is independent, so multiple files are generated in
+    separate worker processes (up to jobs, default: CPU count). The whole
+    batch shares one timestamp. Returns one result dict per input, in order.
+    """
+    pipeline = generate_bundle if bundle else generate
+    options.setdefault("timestamp", time.strftime(TIMESTAMP_FORMAT))
+    if len(json_paths) == 1 or jobs == 1:
+        return [pipeline(path, **options) for path in json_paths]
+
+    from concurrent.futures import ProcessPoolExecutor  # Only needed for batches
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(pipeline, path, **options) for path in json_paths]
+        return [future.result() for future in futures]
+
+
 def find_json_file(input_arg: str) -> Optional[Path]:
     """Find JSON file from argument (supports multiple search locations)."""
-    base_dir = Path(__file__).parent
-    characters_dir = base_dir / "characters"
-
     # Try as absolute/relative path first
     path = Path(input_arg)
     if path.is_file():
         return path
 
     # Try in characters folder: "aldric" -> characters/aldric.json
-    path = characters_dir / f"{input_arg}.json"
+    path = CHARACTERS_DIR / f"{input_arg}.json"
     if path.is_file():
         return path
 
     # Try with .json extension in characters folder
-    path = characters_dir / input_arg
+    path = CHARACTERS_DIR / input_arg
     if path.is_file():
         return path
 
@@ -275,92 +375,79 @@ def generate_bundle(
     pdf: bool = False,
     compress: bool = False,
     dpi: int = 150,
-    open_files: bool = False
+    open_files: bool = False,
+    link_css: bool = False,
+    minify: bool = False,
+    gzip_output: bool = False,
+    timestamp: Optional[str] = None
 ) -> dict:
     """
     Generate character sheet bundled with their items.
 
+    timestamp names the archived files (default: now, in TIMESTAMP_FORMAT).
+
     Returns dict with paths to generated files:
         {"html": Path, "pdf": Path|None, "compressed": Path|None}
     """
-    base_dir = Path(__file__).parent
     if output_dir is None:
-        output_dir = base_dir / "output"
+        output_dir = OUTPUT_DIR
+    if timestamp is None:
+        timestamp = time.strftime(TIMESTAMP_FORMAT)
 
     # Load character data
-    with open(json_path, 'r', encoding='utf-8') as f:
-        char_data = json.load(f)
-
-    char_name = char_data.get("header", {}).get("character_name", "character")
-    safe_name = char_name.replace(" ", "_")
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
+    char_data = load_json(json_path)
 
-    # Generate character HTML (with item CSS included for bundled items)
-    char_doc = CharacterDocument(char_data)
-    char_html = char_doc.build_html()
+    safe_name, doc_output_dir = output_location(char_data, output_dir)
 
     # Get embedded items from character data
     embedded_items = get_embedded_items(char_data)
 
-    # If we have items, inject the item CSS into the character HTML
-    if embedded_items:
-        item_css = char_doc.load_css("item.css")
-        # Insert item CSS before </style>
-        style_end = char_html.find("</style>")
-        if style_end > 0:
-            char_html = char_html[:style_end] + "\n" + item_css + "\n    " + char_html[style_end:]
-
-    # Generate item HTML
-    items_html_parts = []
-
-    for item_data in embedded_items:
-        base_path = "../.."  # Relative path from output/<char>/ to project root
-        item_doc = ItemDocument(item_data, base_path)
-
-        # Get just the body content (pages) from item HTML
-        full_html = item_doc.build_html()
-        # Extract body content between <body> and </body>
-        body_start = full_html.find("<body>") + 6
-        body_end = full_html.find("</body>")
-        if body_start > 5 and body_end > body_start:
-            items_html_parts.append(full_html[body_start:body_end])
+    # Generate character HTML (with item CSS included for bundled items)
+    char_doc = CharacterDocument(char_data, link_css=link_css, minify=minify)
+    char_html = char_doc.build_html(extra_css=("item.css",) if embedded_items else ())
 
     # Combine character and items into single HTML
-    # Insert items after character pages but before </body>
-    if items_html_parts:
+    # Insert item pages after character pages but before </body>
+    if embedded_items:
         body_end = char_html.find("</body>")
-        combined_html = (
-            char_html[:body_end] +
-            "\n    <!-- ITEMS -->" +
-            "".join(items_html_parts) +
-            "\n" +
-            char_html[body_end:]
-        )
+        parts = [char_html[:body_end], "\n    <!-- ITEMS -->"]
+
+        for item_data in embedded_items:
+            base_path = "../.."  # Relative path from output/<char>/ to project root
+            item_doc = ItemDocument(item_data, base_path, link_css)
+            parts.append(item_doc.build_pages())
+            parts.append("\n")
+
+        parts.append("\n")
+        parts.append(char_html[body_end:])
+        combined_html = "".join(parts)
     else:
         combined_html = char_html
 
+    if minify:
+        combined_html = minify_html(combined_html)
+
     # Ensure output directory exists
-    doc_output_dir = output_dir / safe_name
     doc_output_dir.mkdir(parents=True, exist_ok=True)
 
     # Write combined HTML
     html_path = doc_output_dir / f"{safe_name}_bundle_{timestamp}.html"
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(combined_html)
+    html_bytes = combined_html.encode("utf-8")
+    html_path = write_archive(html_path, html_bytes, gzip_output)
 
     result = {"html": html_path, "pdf": None, "compressed": None}
     print(f"[HTML] {html_path}")
     if embedded_items:
         print(f"       (includes {len(embedded_items)} item(s))")
 
-    # Copy to stable "latest" filename
+    # Write the same bytes to stable "latest" filename
     latest_html = doc_output_dir / f"{safe_name}.html"
-    shutil.copy2(html_path, latest_html)
+    latest_html.write_bytes(html_bytes)
 
     # Generate PDF if requested
     if pdf or compress:
         pdf_path = doc_output_dir / f"{safe_name}_bundle_{timestamp}.pdf"
-        if generate_pdf(html_path, pdf_path):
+        if generate_pdf(latest_html, pdf_path):
             result["pdf"] = pdf_path
             print(f"[PDF]  {pdf_path} ({get_file_size(pdf_path)})")
 
@@ -377,7 +464,7 @@ def generate_bundle(
 
     # Open files if requested
     if open_files:
-        open_file(html_path)
+        open_file(latest_html)
         if result["compressed"]:
             open_file(result["compressed"])
         elif result["pdf"]:
@@ -401,36 +488,46 @@ Examples:
   python3 generate.py aldric --pdf                    # Generate HTML + PDF
   python3 generate.py aldric --compress --open        # Full pipeline + open
   python3 generate.py aldric --bundle --compress      # Character + all items
+  python3 generate.py characters/*.json --pdf         # Several files in parallel
         """
     )
-    parser.add_argument("input", nargs="?", help="JSON file (character or item)")
+    parser.add_argument("input", nargs="*", help="JSON file(s) (character or item)")
     parser.add_argument("--pdf", action="store_true", help="Generate PDF via Chrome headless")
     parser.add_argument("--compress", action="store_true", help="Compress PDF for printing (implies --pdf)")
     parser.add_argument("--dpi", type=int, default=150, help="DPI for compression (default: 150)")
     parser.add_argument("--open", action="store_true", help="Open output files when done")
     parser.add_argument("--output", type=Path, help="Custom output directory")
     parser.add_argument("--bundle", action="store_true", help="Include character's items in output")
+    parser.add_argument("--link-css", action="store_true",
+                        help="Link stylesheets from styles/ instead of inlining them")
+    parser.add_argument("--minify", action="store_true", help="Strip indentation from the HTML and comments from inlined CSS")
+    parser.add_argument("--jobs", type=int, help="Worker processes when generating several files (default: CPU count)")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the timestamped HTML archive (.html.gz)")
 
     args = parser.parse_args()
 
-    # Find input file
-    if args.input:
-        json_path = find_json_file(args.input)
+    # Find input files
+    json_paths = []
+    for input_arg in args.input:
+        json_path = find_json_file(input_arg)
         if not json_path:
-            print(f"Error: Could not find {args.input}")
+            print(f"Error: Could not find {input_arg}")
             sys.exit(1)
-    else:
+        json_paths.append(json_path)
+
+    if not json_paths:
         # Default to first character JSON in characters/*.json
-        base_dir = Path(__file__).parent
-        characters_dir = base_dir / "characters"
-        json_files = sorted(characters_dir.glob("*.json"))
+        json_files = sorted(CHARACTERS_DIR.glob("*.json"))
         if json_files:
-            json_path = json_files[0]
+            json_paths.append(json_files[0])
         else:
             print("Error: No character files found. Provide a JSON file path.")
             parser.print_help()
             sys.exit(1)
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     # Compress implies PDF
     if args.compress:
         args.pdf = True
@@ -438,28 +535,25 @@ Examples:
     # Run generation
     print("=== D&D Sheet Generator ===\n")
 
-    if args.bundle:
-        result = generate_bundle(
-            json_path=json_path,
-            output_dir=args.output,
-            pdf=args.pdf,
-            compress=args.compress,
-            dpi=args.dpi,
-            open_files=args.open
-        )
-    else:
-        result = generate(
-            json_path=json_path,
-            output_dir=args.output,
-            pdf=args.pdf,
-            compress=args.compress,
-            dpi=args.dpi,
-            open_files=args.open
-        )
+    results = generate_batch(
+        json_paths,
+        bundle=args.bundle,
+        jobs=args.jobs,
+        output_dir=args.output,
+        pdf=args.pdf,
+        compress=args.compress,
+        dpi=args.dpi,
+        open_files=args.open,
+        link_css=args.link_css,
+        minify=args.minify,
+        gzip_output=args.gzip
+    )
 
     print("\n=== Done! ===")
 
-    return result["html"]
+    if len(results) == 1:
+        return results[0]["html"]
+    return [result["html"] for result in results]
 
 
 if __name__ == "__main__":
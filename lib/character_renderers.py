@@ -5,7 +5,7 @@ Specialized renderers for D&D character sheet elements.
 """
 
 from typing import Optional
-from .renderers import ContentRenderer, register_renderer
+from .renderers import ContentRenderer, register_renderer, LIST_ITEM, escape_attr, BlankDefaults
 
 
 # =============================================================================
@@ -123,20 +123,18 @@ class AttacksRenderer(ContentRenderer):
         attacks = content.get("attacks", [])
         min_rows = content.get("min_rows", 5)
 
-        html = "".join([
+        rows = [
             self.TEMPLATE.format(
                 name=a.get("name", ""),
                 atk_bonus=a.get("atk_bonus", ""),
                 damage_type=a.get("damage_type", "")
             )
             for a in attacks
-        ])
+        ]
 
-        # Pad with empty rows
-        empty_count = max(0, min_rows - len(attacks))
-        html += self.EMPTY_TEMPLATE * empty_count
-
-        return html
+        # Pad with empty rows, joined in the same pass
+        rows.append(self.EMPTY_TEMPLATE * max(0, min_rows - len(attacks)))
+        return "".join(rows)
 
 
 # =============================================================================
@@ -148,17 +146,21 @@ class CombatStatsRenderer(ContentRenderer):
 
     content_type = "combat_stats"
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        stats = content.get("stats", [])
-        html = ""
-
-        for stat in stats:
-            html += f'''
+    TEMPLATE = '''
                     <div class="box box--label-bottom combat-stat">
-                        <div class="combat-value value--xlarge">{stat.get("value", "")}</div>
-                        <div class="box__label">{stat.get("label", "")}</div>
+                        <div class="combat-value value--xlarge">{value}</div>
+                        <div class="box__label">{label}</div>
                     </div>'''
 
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        stats = content.get("stats", [])
+        html = "".join([
+            self.TEMPLATE.format(
+                value=stat.get("value", ""),
+                label=stat.get("label", "")
+            )
+            for stat in stats
+        ])
         return f'<div class="combat-row">{html}</div>'
 
 
@@ -171,25 +173,23 @@ class HitPointsRenderer(ContentRenderer):
 
     content_type = "hit_points"
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        hp_max = content.get("hp_maximum", "")
-        hp_current = content.get("hp_current", "")
-        hp_temp = content.get("hp_temporary", "")
-
-        return f'''
+    TEMPLATE = '''
                 <div class="box box--label-bottom hp-section">
                     <div class="hp-max-row">
                         <div class="hp-max-label">Hit Point Maximum</div>
-                        <div class="hp-max-value">{hp_max}</div>
+                        <div class="hp-max-value">{hp_maximum}</div>
                     </div>
                     <div class="hp-current">{hp_current}</div>
                     <div class="box__label">Current Hit Points</div>
                 </div>
                 <div class="box box--label-bottom hp-temp">
-                    <div class="hp-temp-value">{hp_temp}</div>
+                    <div class="hp-temp-value">{hp_temporary}</div>
                     <div class="box__label">Temporary Hit Points</div>
                 </div>'''
 
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        return self.TEMPLATE.format_map(BlankDefaults(content))
+
 
 # =============================================================================
 # HIT DICE & DEATH SAVES
@@ -200,38 +200,41 @@ class HitDiceDeathSavesRenderer(ContentRenderer):
 
     content_type = "hit_dice_death"
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        hit_dice = content.get("hit_dice", {})
-        death_saves = content.get("death_saves", {})
+    # Three empty death save circles, built once
+    DEATH_CIRCLES = '''
+                                <div class="death-circle"></div>''' * 3
 
-        return f'''
+    TEMPLATE = '''
                 <div class="hitdice-death-row">
                     <div class="box box--label-bottom hitdice-box">
-                        <div class="hitdice-total">Total: {hit_dice.get("total", "")}</div>
-                        <div class="hitdice-value">{hit_dice.get("current", "")}</div>
+                        <div class="hitdice-total">Total: {total}</div>
+                        <div class="hitdice-value">{current}</div>
                         <div class="box__label">Hit Dice</div>
                     </div>
                     <div class="box box--label-bottom death-box">
                         <div class="death-row">
                             <div class="death-label">Successes</div>
-                            <div class="death-circles">
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
+                            <div class="death-circles">{circles}
                             </div>
                         </div>
                         <div class="death-row">
                             <div class="death-label">Failures</div>
-                            <div class="death-circles">
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
+                            <div class="death-circles">{circles}
                             </div>
                         </div>
                         <div class="box__label">Death Saves</div>
                     </div>
                 </div>'''
 
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        hit_dice = content.get("hit_dice", {})
+
+        return self.TEMPLATE.format(
+            total=hit_dice.get("total", ""),
+            current=hit_dice.get("current") or "",
+            circles=self.DEATH_CIRCLES
+        )
+
 
 # =============================================================================
 # CURRENCY
@@ -242,17 +245,22 @@ class CurrencyRenderer(ContentRenderer):
 
     content_type = "currency"
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        currency = content.get("currency", {})
-        return f'''
+    TEMPLATE = '''
                     <div class="coin-row">
-                        <div class="coin coin--cp"><div class="coin-icon">{currency.get("cp", 0)}</div><div class="coin-label">Copper</div></div>
-                        <div class="coin coin--sp"><div class="coin-icon">{currency.get("sp", 0)}</div><div class="coin-label">Silver</div></div>
-                        <div class="coin coin--ep"><div class="coin-icon">{currency.get("ep", 0)}</div><div class="coin-label">Electrum</div></div>
-                        <div class="coin coin--gp"><div class="coin-icon">{currency.get("gp", 0)}</div><div class="coin-label">Gold</div></div>
-                        <div class="coin coin--pp"><div class="coin-icon">{currency.get("pp", 0)}</div><div class="coin-label">Platinum</div></div>
+                        <div class="coin coin--cp"><div class="coin-icon">{cp}</div><div class="coin-label">Copper</div></div>
+                        <div class="coin coin--sp"><div class="coin-icon">{sp}</div><div class="coin-label">Silver</div></div>
+                        <div class="coin coin--ep"><div class="coin-icon">{ep}</div><div class="coin-label">Electrum</div></div>
+                        <div class="coin coin--gp"><div class="coin-icon">{gp}</div><div class="coin-label">Gold</div></div>
+                        <div class="coin coin--pp"><div class="coin-icon">{pp}</div><div class="coin-label">Platinum</div></div>
                     </div>'''
 
+    # Coins missing from the data render as 0
+    DEFAULTS = {"cp": 0, "sp": 0, "ep": 0, "gp": 0, "pp": 0}
+
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        currency = content.get("currency", {})
+        return self.TEMPLATE.format_map({**self.DEFAULTS, **currency})
+
 
 # =============================================================================
 # SPELL LEVEL
@@ -275,39 +283,17 @@ class SpellLevelRenderer(ContentRenderer):
                         <span></span>
                     </div>'''
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        level = content.get("level", 0)
-        slots_total = content.get("slots_total", 0)
-        slots_expended = content.get("slots_expended", 0)
-        spells = content.get("spells", [])
-        min_rows = content.get("min_rows", 8)
-
-        # Render spells
-        spells_html = "".join([
-            self.SPELL_TEMPLATE.format(
-                name=s.get("name", ""),
-                filled="filled" if s.get("prepared") else ""
-            )
-            for s in spells
-        ])
-
-        # Pad with empty rows
-        empty_count = max(0, min_rows - len(spells))
-        spells_html += self.EMPTY_TEMPLATE * empty_count
-
-        if level == 0:
-            # Cantrips box
-            return f'''
+    CANTRIP_TEMPLATE = '''
             <div class="box spell-level-box cantrip-box">
                 <div class="spell-level-header">
                     <div class="spell-level-num">0</div>
                     <div style="font-size: 6.5pt; font-weight: 700; text-transform: uppercase;">Cantrips</div>
                 </div>
-                <div class="spell-list">{spells_html}
+                <div class="spell-list">{spells}
                 </div>
             </div>'''
-        else:
-            return f'''
+
+    LEVEL_TEMPLATE = '''
             <div class="box spell-level-box">
                 <div class="spell-level-header">
                     <div class="spell-level-num">{level}</div>
@@ -322,10 +308,39 @@ class SpellLevelRenderer(ContentRenderer):
                         </div>
                     </div>
                 </div>
-                <div class="spell-list">{spells_html}
+                <div class="spell-list">{spells}
                 </div>
             </div>'''
 
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        level = content.get("level", 0)
+        slots_total = content.get("slots_total", 0)
+        slots_expended = content.get("slots_expended", 0)
+        spells = content.get("spells", [])
+        min_rows = content.get("min_rows", 8)
+
+        # Render spells
+        rows = [
+            self.SPELL_TEMPLATE.format(
+                name=s.get("name", ""),
+                filled="filled" if s.get("prepared") else ""
+            )
+            for s in spells
+        ]
+
+        # Pad with empty rows, joined in the same pass
+        rows.append(self.EMPTY_TEMPLATE * max(0, min_rows - len(spells)))
+        spells_html = "".join(rows)
+
+        if level == 0:
+            return self.CANTRIP_TEMPLATE.format(spells=spells_html)
+        return self.LEVEL_TEMPLATE.format(
+            level=level,
+            slots_total=slots_total,
+            slots_expended=slots_expended,
+            spells=spells_html
+        )
+
 
 # =============================================================================
 # GALLERY
@@ -347,7 +362,7 @@ class GalleryRenderer(ContentRenderer):
             return ""
 
         items_html = "".join([
-            self.TEMPLATE.format(src=img)
+            self.TEMPLATE.format(src=escape_attr(img))
             for img in images
         ])
 
@@ -543,6 +558,43 @@ class CompanionRenderer(ContentRenderer):
 
     content_type = "companion"
 
+    # Stat block ability order: (data key, display name)
+    ABILITIES = (
+        ("str", "STR"), ("dex", "DEX"), ("con", "CON"),
+        ("int", "INT"), ("wis", "WIS"), ("cha", "CHA"),
+    )
+
+    TEMPLATE = '''
+                <div class="box companion-block box--flex">
+                    <div class="companion-header-row">
+                        <div class="companion-header">
+                            <div class="companion-name">{name}</div>
+                            <div class="companion-type">{size} {type}</div>
+                        </div>{image_html}
+                    </div>
+                    <div class="companion-stats-row">
+                        <div class="companion-stat"><span class="companion-stat-label">AC</span> {armor_class}</div>
+                        <div class="companion-stat"><span class="companion-stat-label">HP</span> {hit_points} <span style="font-size: 6pt; color: #666;">({hp_notes})</span></div>
+                        <div class="companion-stat"><span class="companion-stat-label">Speed</span> {speed}</div>
+                    </div>
+                    <div class="companion-abilities">{abilities_html}
+                    </div>
+                    <div class="companion-stats-row">
+                        <div class="companion-stat"><span class="companion-stat-label">Skills</span> {skills}</div>
+                        <div class="companion-stat"><span class="companion-stat-label">Senses</span> {senses}</div>
+                    </div>
+                    <div class="companion-section">
+                        <div class="companion-section-title">Traits</div>{traits_html}
+                    </div>
+                    <div class="companion-section">
+                        <div class="companion-section-title">Actions</div>{actions_html}
+                    </div>
+                    <div class="companion-section">
+                        <div class="companion-section-title">Beast Master Commands</div>
+                        <ul class="companion-commands">{commands_html}</ul>
+                    </div>
+                </div>'''
+
     ABILITY_TEMPLATE = '''
                         <div class="companion-ability">
                             <div class="companion-ability-name">{name}</div>
@@ -570,15 +622,11 @@ class CompanionRenderer(ContentRenderer):
         # Companion abilities
         abilities = companion.get("abilities", {})
         ability_items = []
-        for ability in ["str", "dex", "con", "int", "wis", "cha"]:
+        for ability, name in self.ABILITIES:
             score = abilities.get(ability, 10)
-            mod = (score - 10) // 2
-            mod_str = f"+{mod}" if mod >= 0 else str(mod)
-            ability_items.append({"name": ability.upper(), "score": score, "mod": mod_str})
-
-        abilities_html = "".join([
-            self.ABILITY_TEMPLATE.format(**a) for a in ability_items
-        ])
+            mod = self.format_modifier(self.ability_modifier(score))
+            ability_items.append(self.ABILITY_TEMPLATE.format(name=name, score=score, mod=mod))
+        abilities_html = "".join(ability_items)
 
         # Traits and actions
         traits_html = "".join([
@@ -591,7 +639,7 @@ class CompanionRenderer(ContentRenderer):
         ])
 
         # Commands
-        commands_html = "".join([f"<li>{cmd}</li>" for cmd in companion.get("commands", [])])
+        commands_html = "".join(map(LIST_ITEM, companion.get("commands", [])))
 
         # Image
         companion_image = companion.get("image", "")
@@ -599,39 +647,18 @@ class CompanionRenderer(ContentRenderer):
         if companion_image:
             image_html = f'''
                         <div class="companion-portrait">
-                            <img src="{companion_image}" alt="{companion.get("name", "Companion")}" class="companion-img">
+                            <img src="{escape_attr(companion_image)}" alt="{escape_attr(companion.get("name", "Companion"))}" class="companion-img">
                         </div>'''
 
-        return f'''
-                <div class="box companion-block box--flex">
-                    <div class="companion-header-row">
-                        <div class="companion-header">
-                            <div class="companion-name">{companion.get("name", "")}</div>
-                            <div class="companion-type">{companion.get("size", "")} {companion.get("type", "")}</div>
-                        </div>{image_html}
-                    </div>
-                    <div class="companion-stats-row">
-                        <div class="companion-stat"><span class="companion-stat-label">AC</span> {companion.get("armor_class", "")}</div>
-                        <div class="companion-stat"><span class="companion-stat-label">HP</span> {companion.get("hit_points", "")} <span style="font-size: 6pt; color: #666;">({companion.get("hp_notes", "")})</span></div>
-                        <div class="companion-stat"><span class="companion-stat-label">Speed</span> {companion.get("speed", "")}</div>
-                    </div>
-                    <div class="companion-abilities">{abilities_html}
-                    </div>
-                    <div class="companion-stats-row">
-                        <div class="companion-stat"><span class="companion-stat-label">Skills</span> {companion.get("skills", "")}</div>
-                        <div class="companion-stat"><span class="companion-stat-label">Senses</span> {companion.get("senses", "")}</div>
-                    </div>
-                    <div class="companion-section">
-                        <div class="companion-section-title">Traits</div>{traits_html}
-                    </div>
-                    <div class="companion-section">
-                        <div class="companion-section-title">Actions</div>{actions_html}
-                    </div>
-                    <div class="companion-section">
-                        <div class="companion-section-title">Beast Master Commands</div>
-                        <ul class="companion-commands">{commands_html}</ul>
-                    </div>
-                </div>'''
+        # Stat fields missing from the companion data render blank
+        return self.TEMPLATE.format_map(BlankDefaults(
+            companion,
+            image_html=image_html,
+            abilities_html=abilities_html,
+            traits_html=traits_html,
+            actions_html=actions_html,
+            commands_html=commands_html,
+        ))
 
 
 # =============================================================================
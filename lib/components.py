@@ -16,6 +16,42 @@ from typing import Any, Optional, Union
 from .renderers import render_content
 
 
+# =============================================================================
+# CHILD RENDERING
+# =============================================================================
+
+def render_children(children: list, context: Optional[dict] = None) -> str:
+    """Render layout children (components, raw HTML strings, or content dicts)."""
+    parts = []
+    for child in children:
+        if hasattr(child, 'render'):
+            parts.append(child.render(context))
+        elif isinstance(child, str):
+            parts.append(child)
+        elif isinstance(child, dict):
+            parts.append(render_content(child, context))
+    return "".join(parts)
+
+
+# Gap modifier classes per container; the default gap ("md" for rows and
+# grids, "sm" for columns) needs no class
+ROW_GAP_CLASSES = {
+    "xs": "row--gap-xs",
+    "sm": "row--gap-sm",
+    "lg": "row--gap-lg",
+    "none": "row--no-gap",
+}
+COL_GAP_CLASSES = {
+    "xs": "col--gap-xs",
+    "md": "col--gap-md",
+    "none": "col--no-gap",
+}
+GRID_GAP_CLASSES = {
+    "sm": "grid--gap-sm",
+    "lg": "grid--gap-lg",
+}
+
+
 # =============================================================================
 # ROW - Horizontal flex container
 # =============================================================================
@@ -37,11 +73,9 @@ class Row:
         classes = ["row"]
 
         # Gap modifier
-        if self.gap in ("xs", "sm", "lg"):
-            classes.append(f"row--gap-{self.gap}")
-        elif self.gap == "none":
-            classes.append("row--no-gap")
-        # "md" is default, no class needed
+        gap_class = ROW_GAP_CLASSES.get(self.gap)
+        if gap_class:
+            classes.append(gap_class)
 
         if self.stretch:
             classes.append("row--stretch")
@@ -56,14 +90,7 @@ class Row:
         style_attr = f' style="{self.style}"' if self.style else ""
 
         # Render children
-        children_html = ""
-        for child in self.children:
-            if hasattr(child, 'render'):
-                children_html += child.render(context)
-            elif isinstance(child, str):
-                children_html += child
-            elif isinstance(child, dict):
-                children_html += render_content(child, context)
+        children_html = render_children(self.children, context)
 
         return f'<div class="{class_str}"{style_attr}>{children_html}</div>'
 
@@ -96,13 +123,9 @@ class Col:
             classes.append(f"col--{self.flex}")
 
         # Gap modifier
-        if self.gap == "xs":
-            classes.append("col--gap-xs")
-        elif self.gap == "md":
-            classes.append("col--gap-md")
-        elif self.gap == "none":
-            classes.append("col--no-gap")
-        # "sm" is default, no class needed
+        gap_class = COL_GAP_CLASSES.get(self.gap)
+        if gap_class:
+            classes.append(gap_class)
 
         if self.css_class:
             classes.append(self.css_class)
@@ -111,14 +134,7 @@ class Col:
         style_attr = f' style="{self.style}"' if self.style else ""
 
         # Render children
-        children_html = ""
-        for child in self.children:
-            if hasattr(child, 'render'):
-                children_html += child.render(context)
-            elif isinstance(child, str):
-                children_html += child
-            elif isinstance(child, dict):
-                children_html += render_content(child, context)
+        children_html = render_children(self.children, context)
 
         return f'<div class="{class_str}"{style_attr}>{children_html}</div>'
 
@@ -147,11 +163,9 @@ class Grid:
         classes = ["grid", f"grid--{self.columns}col"]
 
         # Gap modifier
-        if self.gap == "sm":
-            classes.append("grid--gap-sm")
-        elif self.gap == "lg":
-            classes.append("grid--gap-lg")
-        # "md" is default, no class needed
+        gap_class = GRID_GAP_CLASSES.get(self.gap)
+        if gap_class:
+            classes.append(gap_class)
 
         if self.css_class:
             classes.append(self.css_class)
@@ -160,14 +174,7 @@ class Grid:
         style_attr = f' style="{self.style}"' if self.style else ""
 
         # Render children
-        children_html = ""
-        for child in self.children:
-            if hasattr(child, 'render'):
-                children_html += child.render(context)
-            elif isinstance(child, str):
-                children_html += child
-            elif isinstance(child, dict):
-                children_html += render_content(child, context)
+        children_html = render_children(self.children, context)
 
         return f'<div class="{class_str}"{style_attr}>{children_html}</div>'
 
@@ -7,60 +7,175 @@ Base Document class and specialized CharacterDocument and ItemDocument classes.
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from .components import Page, Section
-from .renderers import render_content
+from .renderers import ContentRenderer, escape_attr, render_content
 from .pages import StatsPage, BackgroundPage, SpellcastingPage, ReferencePage
 
 
+# SVG decoration patterns, compiled once at import
+SVG_PATH_PATTERN = re.compile(r'<path[^>]*d="([^"]*)"')
+SVG_VIEWBOX_PATTERN = re.compile(r'viewBox="([^"]*)"')
+
+
 # =============================================================================
-# BASE DOCUMENT
+# STYLESHEETS
 # =============================================================================
 
-class Document(ABC):
-    """Base class for all document types."""
+STYLES_DIR = Path(__file__).parent.parent / "styles"
 
-    def __init__(self, data: dict, base_path: str = ""):
-        self.data = data
-        self.base_path = base_path
-        self.meta = data.get("meta", {})
 
-    @abstractmethod
-    def build_html(self) -> str:
-        """Build complete HTML document."""
-        pass
+@lru_cache(maxsize=None)
+def read_stylesheet(filename: str) -> Optional[str]:
+    """Read a stylesheet from the styles folder, cached for the process lifetime."""
+    try:
+        return (STYLES_DIR / filename).read_text()
+    except FileNotFoundError:
+        return None
 
-    def load_css(self, *css_files: str) -> str:
-        """Load and combine CSS from files."""
-        styles_dir = Path(__file__).parent.parent / "styles"
-        css_parts = []
 
-        for filename in css_files:
-            css_path = styles_dir / filename
-            if css_path.exists():
-                css_parts.append(css_path.read_text())
+@lru_cache(maxsize=None)
+def combine_stylesheets(*css_files: str) -> str:
+    """Combine stylesheets into one CSS block, cached per file combination."""
+    css_parts = []
 
-        return "\n".join(css_parts)
+    for filename in css_files:
+        css = read_stylesheet(filename)
+        if css is not None:
+            css_parts.append(css)
 
-    def html_wrapper(self, title: str, css: str, body: str) -> str:
-        """Wrap content in complete HTML document."""
-        return f'''<!DOCTYPE html>
+    return "\n".join(css_parts)
+
+
+# Comments, whitespace runs, and the spaces around braces/semicolons/commas
+CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+CSS_WHITESPACE_PATTERN = re.compile(r"\s+")
+CSS_PUNCTUATION_PATTERN = re.compile(r" ?([{};,]) ?")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a stylesheet."""
+    css = CSS_COMMENT_PATTERN.sub("", css)
+    css = CSS_WHITESPACE_PATTERN.sub(" ", css)
+    return CSS_PUNCTUATION_PATTERN.sub(r"\1", css).strip()
+
+
+# =============================================================================
+# SVG DECORATIONS
+# =============================================================================
+
+SVG_DECORATION_TEMPLATE = '''
+            <svg class="header-bg-decoration" viewBox="{viewbox}" preserveAspectRatio="xMidYMid slice">
+                <path d="{path_d}"/>
+            </svg>'''
+
+
+@lru_cache(maxsize=None)
+def load_svg_decoration(svg_path: str) -> str:
+    """Load an item header SVG decoration, cached per path for the process lifetime."""
+    if not svg_path:
+        return ""
+
+    full_path = Path(__file__).parent.parent / svg_path
+    try:
+        svg_content = full_path.read_text()
+    except FileNotFoundError:
+        return ""
+
+    path_match = SVG_PATH_PATTERN.search(svg_content)
+    if not path_match:
+        return ""
+
+    viewbox_match = SVG_VIEWBOX_PATTERN.search(svg_content)
+    viewbox = viewbox_match.group(1) if viewbox_match else "0 0 2893.32 468.16"
+
+    return SVG_DECORATION_TEMPLATE.format(viewbox=viewbox, path_d=path_match.group(1))
+
+
+# =============================================================================
+# HTML SKELETON
+# =============================================================================
+
+# Shared page skeleton for every document type. Defined once at import so each
+# build only fills in the title, stylesheet, and rendered pages.
+HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
     <link href="https://fonts.googleapis.com/css2?family=Cinzel:wght@400;500;600;700&family=Scada:wght@400;700&display=swap" rel="stylesheet">
-    <style>
-{css}
-    </style>
+{styles}
 </head>
 <body>{body}
 </body>
 </html>'''
 
+# Stylesheets inlined into the head (default)
+STYLE_TEMPLATE = '''    <style>
+{css}
+    </style>'''
+
+# Stylesheets referenced from the styles folder (--link-css)
+LINK_TEMPLATE = '''    <link rel="stylesheet" href="{href}">'''
+
+
+@lru_cache(maxsize=None)
+def build_head_styles(link_css: bool, minify: bool, *css_files: str) -> str:
+    """Build the head stylesheet markup, cached per mode and file combination."""
+    if link_css:
+        return "\n".join([
+            LINK_TEMPLATE.format(href=(STYLES_DIR / filename).as_uri())
+            for filename in css_files
+            if (STYLES_DIR / filename).exists()
+        ])
+    css = combine_stylesheets(*css_files)
+    if minify:
+        css = minify_css(css)
+    return STYLE_TEMPLATE.format(css=css)
+
+
+# =============================================================================
+# BASE DOCUMENT
+# =============================================================================
+
+class Document(ABC):
+    """Base class for all document types."""
+
+    # Stylesheets inlined into the document, in cascade order
+    CSS_FILES: tuple[str, ...] = ("base.css", "components.css")
+
+    def __init__(self, data: dict, base_path: str = "", link_css: bool = False,
+                 minify: bool = False):
+        self.data = data
+        self.base_path = base_path
+        self.link_css = link_css
+        self.minify = minify
+        self.meta = data.get("meta", {})
+
+    @abstractmethod
+    def build_html(self) -> str:
+        """Build complete HTML document."""
+        pass
+
+    def head_styles(self, *css_files: str) -> str:
+        """
+        Build the stylesheet markup for the document head.
+
+        Inlines the combined CSS in a <style> block by default. With link_css,
+        emits <link> tags to the files in the styles folder instead, so the
+        browser parses each stylesheet once across a batch of documents.
+        With minify, the inlined CSS is stripped of comments and whitespace.
+        """
+        return build_head_styles(self.link_css, self.minify, *css_files)
+
+    def html_wrapper(self, title: str, styles: str, body: str) -> str:
+        """Wrap content in complete HTML document."""
+        return HTML_TEMPLATE.format(title=title, styles=styles, body=body)
+
 
 # =============================================================================
 # ITEM DOCUMENT
@@ -69,32 +184,62 @@ class Document(ABC):
 class ItemDocument(Document):
     """Document class for magic items."""
 
-    def __init__(self, data: dict, base_path: str = ""):
-        super().__init__(data, base_path)
+    CSS_FILES = ("base.css", "components.css", "item.css")
+
+    HEADER_TEMPLATE = '''
+        <div class="item-header">{svg}{image}
+            <div class="item-title-block">
+                <div class="item-title-group">
+                    <div class="item-name">{name}</div>
+                    {subtitle}
+                </div>
+                <div class="item-stats-row">{stats}
+                </div>
+            </div>
+        </div>'''
+
+    IMAGE_TEMPLATE = '''
+            <div class="item-image-frame">
+                <img src="{src}" alt="{alt}" class="item-image">
+            </div>'''
+
+    FOOTER_TEMPLATE = '''
+        <div class="item-footer">
+            <div>{left}</div>
+            <div class="market-value">{right}</div>
+        </div>'''
+
+    def __init__(self, data: dict, base_path: str = "", link_css: bool = False,
+                 minify: bool = False):
+        super().__init__(data, base_path, link_css, minify)
         self.header_data = data.get("header", {})
         self.footer_data = data.get("footer", {})
         self.pages_data = data.get("pages", [])
 
     def build_html(self) -> str:
         """Build complete HTML for item document."""
-        css = self.load_css("base.css", "components.css", "item.css")
+        styles = self.head_styles(*self.CSS_FILES)
+        pages_html = self.build_pages()
 
+        title = self.header_data.get("name", "Magic Item")
+        return self.html_wrapper(f"{title} - Magic Item", styles, pages_html)
+
+    def build_pages(self) -> str:
+        """Build the item's page markup without the surrounding document."""
         # Render header and footer
         header_html = self._render_header()
         footer_html = self._render_footer()
 
         # Render all pages
-        pages_html = ""
+        pages = []
         for i, page_data in enumerate(self.pages_data):
             page = Page.from_dict(
                 page_data,
                 header_html=header_html if i == 0 else "",
                 footer_html=footer_html if i == 0 else ""
             )
-            pages_html += page.render()
-
-        title = self.header_data.get("name", "Magic Item")
-        return self.html_wrapper(f"{title} - Magic Item", css, pages_html)
+            pages.append(page.render())
+        return "".join(pages)
 
     def _render_header(self) -> str:
         """Render item header with image, title, and stats."""
@@ -120,59 +265,31 @@ class ItemDocument(Document):
         subtitle_html = f'<div class="item-subtitle">{subtitle}</div>' if subtitle else ""
 
         # Image section (only if image exists)
+        image_html = ""
         if image_path:
-            image_html = f'''
-            <div class="item-image-frame">
-                <img src="{image_path}" alt="{name}" class="item-image">
-            </div>'''
-        else:
-            image_html = ""
+            image_html = self.IMAGE_TEMPLATE.format(
+                src=escape_attr(image_path),
+                alt=escape_attr(name)
+            )
 
-        return f'''
-        <div class="item-header">{svg_html}{image_html}
-            <div class="item-title-block">
-                <div class="item-title-group">
-                    <div class="item-name">{name}</div>
-                    {subtitle_html}
-                </div>
-                <div class="item-stats-row">{stats_html}
-                </div>
-            </div>
-        </div>'''
+        return self.HEADER_TEMPLATE.format_map({
+            "svg": svg_html,
+            "image": image_html,
+            "name": name,
+            "subtitle": subtitle_html,
+            "stats": stats_html,
+        })
 
     def _render_footer(self) -> str:
         """Render item footer."""
-        left = self.footer_data.get("left", "")
-        right = self.footer_data.get("right", "")
-
-        return f'''
-        <div class="item-footer">
-            <div>{left}</div>
-            <div class="market-value">{right}</div>
-        </div>'''
+        return self.FOOTER_TEMPLATE.format_map({
+            "left": self.footer_data.get("left", ""),
+            "right": self.footer_data.get("right", ""),
+        })
 
     def _load_svg_decoration(self, svg_path: str) -> str:
         """Load SVG decoration from file."""
-        if not svg_path:
-            return ""
-
-        full_path = Path(__file__).parent.parent / svg_path
-        if not full_path.exists():
-            return ""
-
-        svg_content = full_path.read_text()
-        path_match = re.search(r'<path[^>]*d="([^"]*)"', svg_content)
-        if not path_match:
-            return ""
-
-        path_d = path_match.group(1)
-        viewbox_match = re.search(r'viewBox="([^"]*)"', svg_content)
-        viewbox = viewbox_match.group(1) if viewbox_match else "0 0 2893.32 468.16"
-
-        return f'''
-            <svg class="header-bg-decoration" viewBox="{viewbox}" preserveAspectRatio="xMidYMid slice">
-                <path d="{path_d}"/>
-            </svg>'''
+        return load_svg_decoration(svg_path)
 
 
 # =============================================================================
@@ -182,38 +299,14 @@ class ItemDocument(Document):
 class CharacterDocument(Document):
     """Document class for character sheets."""
 
-    # Skill to ability mapping
-    SKILL_ABILITIES = {
-        "acrobatics": ("Dex", "dexterity"),
-        "animal_handling": ("Wis", "wisdom"),
-        "arcana": ("Int", "intelligence"),
-        "athletics": ("Str", "strength"),
-        "deception": ("Cha", "charisma"),
-        "history": ("Int", "intelligence"),
-        "insight": ("Wis", "wisdom"),
-        "intimidation": ("Cha", "charisma"),
-        "investigation": ("Int", "intelligence"),
-        "medicine": ("Wis", "wisdom"),
-        "nature": ("Int", "intelligence"),
-        "perception": ("Wis", "wisdom"),
-        "performance": ("Cha", "charisma"),
-        "persuasion": ("Cha", "charisma"),
-        "religion": ("Int", "intelligence"),
-        "sleight_of_hand": ("Dex", "dexterity"),
-        "stealth": ("Dex", "dexterity"),
-        "survival": ("Wis", "wisdom"),
-    }
-
-    ABILITY_ORDER = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
-    SKILL_ORDER = [
-        "acrobatics", "animal_handling", "arcana", "athletics", "deception",
-        "history", "insight", "intimidation", "investigation", "medicine",
-        "nature", "perception", "performance", "persuasion", "religion",
-        "sleight_of_hand", "stealth", "survival"
-    ]
-
-    def __init__(self, data: dict, base_path: str = ""):
-        super().__init__(data, base_path)
+    CSS_FILES = ("base.css", "components.css", "sheet.css")
+
+    # Page builders in print order
+    PAGES = (StatsPage, BackgroundPage, SpellcastingPage, ReferencePage)
+
+    def __init__(self, data: dict, base_path: str = "", link_css: bool = False,
+                 minify: bool = False):
+        super().__init__(data, base_path, link_css, minify)
         self.header = data.get("header", {})
         self.abilities = data.get("abilities", {})
         self.prof_bonus = data.get("proficiency_bonus", 2)
@@ -224,112 +317,36 @@ class CharacterDocument(Document):
         mods = {}
         for ability, data in self.abilities.items():
             score = data.get("score", 10)
-            mods[ability] = (score - 10) // 2
+            mods[ability] = ContentRenderer.ability_modifier(score)
         return mods
 
     def _format_modifier(self, value: int) -> str:
         """Format modifier with +/- sign."""
-        return f"+{value}" if value >= 0 else str(value)
+        return ContentRenderer.format_modifier(value)
 
-    def _format_skill_name(self, skill: str) -> str:
-        """Format skill name for display."""
-        return skill.replace("_", " ").title()
+    def build_html(self, extra_css: tuple[str, ...] = ()) -> str:
+        """
+        Build complete HTML for character sheet.
 
-    def build_html(self) -> str:
-        """Build complete HTML for character sheet."""
-        css = self.load_css("base.css", "components.css", "sheet.css")
+        extra_css names additional stylesheets to inline after the sheet's
+        own (e.g. item.css when item pages are bundled in).
+        """
+        styles = self.head_styles(*self.CSS_FILES, *extra_css)
 
         # Build context for page builders
         context = {
             "header": self.header,
             "abilities": self.abilities,
             "prof_bonus": self.prof_bonus,
+            "prof_bonus_display": self._format_modifier(self.prof_bonus),
             "ability_mods": self._ability_mods,
         }
 
         # Build all pages using PageBuilder classes
-        pages_html = ""
-        pages_html += StatsPage(self.data, context).build()
-        pages_html += BackgroundPage(self.data, context).build()
-        pages_html += SpellcastingPage(self.data, context).build()
-        pages_html += ReferencePage(self.data, context).build()
+        pages_html = "".join([
+            page_class(self.data, context).build()
+            for page_class in self.PAGES
+        ])
 
         title = self.header.get("character_name", "Character")
-        return self.html_wrapper(f"{title} - Character Sheet", css, pages_html)
-
-    # =========================================================================
-    # HELPER METHODS (kept for backward compatibility if needed)
-    # =========================================================================
-
-    def _render_abilities(self) -> str:
-        """Render ability score boxes."""
-        abilities_list = []
-        for ability in self.ABILITY_ORDER:
-            data = self.abilities.get(ability, {"score": 10})
-            score = data.get("score", 10)
-            mod = (score - 10) // 2
-            abilities_list.append({
-                "name": ability[:3].upper(),
-                "score": score,
-                "modifier": self._format_modifier(mod)
-            })
-
-        return render_content({
-            "type": "ability_scores",
-            "abilities": abilities_list
-        })
-
-    def _render_saves(self) -> str:
-        """Render saving throw rows."""
-        saves_data = self.data.get("saving_throws", {})
-        saves_list = []
-
-        for ability in self.ABILITY_ORDER:
-            save = saves_data.get(ability, {"proficient": False})
-            is_prof = save.get("proficient", False)
-            mod = self._ability_mods.get(ability, 0)
-            if is_prof:
-                mod += self.prof_bonus
-            saves_list.append({
-                "name": ability.capitalize(),
-                "proficient": is_prof,
-                "modifier": self._format_modifier(mod)
-            })
-
-        return render_content({
-            "type": "saving_throws",
-            "saves": saves_list
-        })
-
-    def _render_skills(self) -> str:
-        """Render skill rows."""
-        skills_data = self.data.get("skills", {})
-        skills_list = []
-
-        for skill in self.SKILL_ORDER:
-            skill_info = skills_data.get(skill, {"proficient": False})
-            is_prof = skill_info.get("proficient", False)
-            ability_abbr, ability_name = self.SKILL_ABILITIES.get(skill, ("???", "strength"))
-            mod = self._ability_mods.get(ability_name, 0)
-            if is_prof:
-                mod += self.prof_bonus
-            skills_list.append({
-                "name": self._format_skill_name(skill),
-                "ability": ability_abbr,
-                "proficient": is_prof,
-                "modifier": self._format_modifier(mod)
-            })
-
-        return render_content({
-            "type": "skills",
-            "skills": skills_list
-        })
-
-    def _calculate_passive_perception(self) -> int:
-        """Calculate passive perception."""
-        skills_data = self.data.get("skills", {})
-        perception = skills_data.get("perception", {"proficient": False})
-        mod = self._ability_mods.get("wisdom", 0)
-        if perception.get("proficient", False):
-            mod += self.prof_bonus
-        return 10 + mod
+        return self.html_wrapper(f"{title} - Character Sheet", styles, pages_html)
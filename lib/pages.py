@@ -8,7 +8,53 @@ Each builder creates a complete page with its specific layout and content.
 from abc import ABC, abstractmethod
 from typing import Optional
 from .components import Row, Col, Grid
-from .renderers import render_content
+from .renderers import ContentRenderer, escape_attr, escape_text, render_content
+from .character_renderers import SpellLevelRenderer
+
+
+# =============================================================================
+# SKILL TABLES
+# =============================================================================
+
+# Display order for ability scores and saving throws
+ABILITY_ORDER = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+
+# Ability box labels ("strength" -> "STR") and save names ("strength" -> "Strength")
+ABILITY_LABELS = {ability: ability[:3].upper() for ability in ABILITY_ORDER}
+ABILITY_NAMES = {ability: ability.capitalize() for ability in ABILITY_ORDER}
+
+# Display order for skills (alphabetical, as on the printed sheet)
+SKILL_ORDER = (
+    "acrobatics", "animal_handling", "arcana", "athletics", "deception",
+    "history", "insight", "intimidation", "investigation", "medicine",
+    "nature", "perception", "performance", "persuasion", "religion",
+    "sleight_of_hand", "stealth", "survival",
+)
+
+# Skill to ability mapping: skill -> (ability abbreviation, ability name)
+SKILL_ABILITIES = {
+    "acrobatics": ("Dex", "dexterity"),
+    "animal_handling": ("Wis", "wisdom"),
+    "arcana": ("Int", "intelligence"),
+    "athletics": ("Str", "strength"),
+    "deception": ("Cha", "charisma"),
+    "history": ("Int", "intelligence"),
+    "insight": ("Wis", "wisdom"),
+    "intimidation": ("Cha", "charisma"),
+    "investigation": ("Int", "intelligence"),
+    "medicine": ("Wis", "wisdom"),
+    "nature": ("Int", "intelligence"),
+    "perception": ("Wis", "wisdom"),
+    "performance": ("Cha", "charisma"),
+    "persuasion": ("Cha", "charisma"),
+    "religion": ("Int", "intelligence"),
+    "sleight_of_hand": ("Dex", "dexterity"),
+    "stealth": ("Dex", "dexterity"),
+    "survival": ("Wis", "wisdom"),
+}
+
+# Display names: "sleight_of_hand" -> "Sleight Of Hand"
+SKILL_NAMES = {skill: skill.replace("_", " ").title() for skill in SKILL_ABILITIES}
 
 
 # =============================================================================
@@ -18,6 +64,30 @@ from .renderers import render_content
 class PageBuilder(ABC):
     """Base class for page builders."""
 
+    PAGE_HEADER_TEMPLATE = '''
+        <div class="page-header">
+            <div class="header-left">
+                <div class="header-brand">Dungeons & Dragons</div>{name}
+            </div>
+            <div class="header-right"{right_style}>{fields}
+            </div>
+        </div>'''
+
+    NAME_BOX_TEMPLATE = '''
+                <div class="box box--label-bottom header-name">
+                    <div class="value--large">{value}</div>
+                    <div class="box__label">{label}</div>
+                </div>'''
+
+    # Header-right override for pages with a single row of three fields
+    THREE_FIELD_STYLE = ' style="grid-template-columns: repeat(3, 1fr); grid-template-rows: 1fr;"'
+
+    INFO_FIELD_TEMPLATE = '''
+                <div class="box box--label-bottom box--centered info-field">
+                    <div class="value--medium">{value}</div>
+                    <div class="box__label">{label}</div>
+                </div>'''
+
     def __init__(self, data: dict, context: dict = None):
         self.data = data
         self.context = context or {}
@@ -27,6 +97,33 @@ class PageBuilder(ABC):
         """Build and return the page HTML."""
         pass
 
+    def _prof_bonus_display(self) -> str:
+        """Signed proficiency bonus, preformatted by the document when available."""
+        display = self.context.get("prof_bonus_display")
+        if display is None:
+            display = ContentRenderer.format_modifier(self.context.get("prof_bonus", 2))
+        return display
+
+    def _page_header(self, name_html: str, fields_html: str, right_style: str = "") -> str:
+        """Assemble a page header from its name block and info fields."""
+        return self.PAGE_HEADER_TEMPLATE.format(
+            name=name_html,
+            fields=fields_html,
+            right_style=right_style
+        )
+
+    def _name_box(self, value: str, label: str) -> str:
+        """Render the large labelled name box on the left of a page header."""
+        return self.NAME_BOX_TEMPLATE.format(value=value, label=label)
+
+    def _info_fields(self, source: dict, fields: tuple[tuple[str, str], ...]) -> str:
+        """Render (key, label) pairs from source as header info fields."""
+        template = self.INFO_FIELD_TEMPLATE
+        return "".join([
+            template.format(value=source.get(key, ""), label=label)
+            for key, label in fields
+        ])
+
     def _box(self, content: str, classes: str = "", label: str = "",
              label_position: str = "bottom", style: str = "") -> str:
         """Create a box element with optional label."""
@@ -60,15 +157,21 @@ class ReferencePage(PageBuilder):
     - Companion stat block (optional)
     """
 
+    # Header info fields: (value key, label)
+    HEADER_FIELDS = (
+        ("class_level", "Class & Level"),
+        ("prof_bonus", "Proficiency Bonus"),
+        ("spell_save_dc", "Spell Save DC"),
+    )
+
     def build(self) -> str:
         """Build the reference page."""
         reference = self.data.get("reference", {})
         spellcasting = self.data.get("spellcasting", {})
         header = self.context.get("header", {})
-        prof_bonus = self.context.get("prof_bonus", 2)
 
         # Build header
-        header_html = self._build_header(header, spellcasting, prof_bonus)
+        header_html = self._build_header(header, spellcasting, self._prof_bonus_display())
 
         # Build content sections
         left_col = self._build_left_column(reference)
@@ -85,32 +188,18 @@ class ReferencePage(PageBuilder):
         </div>
     </div>'''
 
-    def _build_header(self, header: dict, spellcasting: dict, prof_bonus: int) -> str:
+    def _build_header(self, header: dict, spellcasting: dict, prof_bonus: str) -> str:
         """Build the reference page header."""
-        return f'''
-        <div class="page-header">
-            <div class="header-left">
-                <div class="header-brand">Dungeons & Dragons</div>
-                <div class="box box--label-bottom header-name">
-                    <div class="value--large">Quick Reference</div>
-                    <div class="box__label">{header.get("character_name", "")}</div>
-                </div>
-            </div>
-            <div class="header-right" style="grid-template-columns: repeat(3, 1fr); grid-template-rows: 1fr;">
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("class_level", "")}</div>
-                    <div class="box__label">Class & Level</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">+{prof_bonus}</div>
-                    <div class="box__label">Proficiency Bonus</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{spellcasting.get("spell_save_dc", "")}</div>
-                    <div class="box__label">Spell Save DC</div>
-                </div>
-            </div>
-        </div>'''
+        values = {
+            "class_level": header.get("class_level", ""),
+            "prof_bonus": prof_bonus,
+            "spell_save_dc": spellcasting.get("spell_save_dc", ""),
+        }
+        return self._page_header(
+            self._name_box("Quick Reference", header.get("character_name", "")),
+            self._info_fields(values, self.HEADER_FIELDS),
+            self.THREE_FIELD_STYLE
+        )
 
     def _build_left_column(self, reference: dict) -> str:
         """Build the left column with turn structure, combat ref, and weapons."""
@@ -195,6 +284,24 @@ class StatsPage(PageBuilder):
     - Gallery
     """
 
+    # Header info fields: (header key, label)
+    HEADER_FIELDS = (
+        ("class_level", "Class & Level"),
+        ("background", "Background"),
+        ("player_name", "Player Name"),
+        ("race", "Race"),
+        ("alignment", "Alignment"),
+        ("experience_points", "Experience Points"),
+    )
+
+    # Personality trait boxes: (personality key, label)
+    PERSONALITY_FIELDS = (
+        ("traits", "Personality Traits"),
+        ("ideals", "Ideals"),
+        ("bonds", "Bonds"),
+        ("flaws", "Flaws"),
+    )
+
     def build(self) -> str:
         """Build the stats page."""
         # Get context values
@@ -234,51 +341,19 @@ class StatsPage(PageBuilder):
 
     def _build_page_header(self, header: dict, portrait: str) -> str:
         """Build the page 1 header with portrait and info fields."""
+        info_fields_html = self._info_fields(header, self.HEADER_FIELDS)
         portrait_html = ""
         if portrait:
             portrait_html = f'''
                     <div class="portrait-frame">
-                        <img src="{portrait}" alt="Character Portrait" class="portrait-img">
+                        <img src="{escape_attr(portrait)}" alt="Character Portrait" class="portrait-img">
                     </div>'''
 
-        return f'''
-        <div class="page-header">
-            <div class="header-left">
-                <div class="header-brand">Dungeons & Dragons</div>
-                <div class="header-name-row">{portrait_html}
-                <div class="box box--label-bottom header-name">
-                    <div class="value--large">{header.get("character_name", "")}</div>
-                    <div class="box__label">Character Name</div>
-                </div>
-                </div>
-            </div>
-            <div class="header-right">
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("class_level", "")}</div>
-                    <div class="box__label">Class & Level</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("background", "")}</div>
-                    <div class="box__label">Background</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("player_name", "")}</div>
-                    <div class="box__label">Player Name</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("race", "")}</div>
-                    <div class="box__label">Race</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("alignment", "")}</div>
-                    <div class="box__label">Alignment</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{header.get("experience_points", "")}</div>
-                    <div class="box__label">Experience Points</div>
-                </div>
-            </div>
-        </div>'''
+        name_box = self._name_box(header.get("character_name", ""), "Character Name")
+        name_html = f'''
+                <div class="header-name-row">{portrait_html}{name_box}
+                </div>'''
+        return self._page_header(name_html, info_fields_html)
 
     def _build_left_section(self, abilities: dict, ability_mods: dict, prof_bonus: int) -> str:
         """Build left column with abilities, saves, skills, proficiencies."""
@@ -286,11 +361,13 @@ class StatsPage(PageBuilder):
         abilities_html = self._render_abilities(abilities, ability_mods)
 
         # Saves and Skills
-        saves_html = self._render_saves(ability_mods, prof_bonus)
-        skills_html = self._render_skills(ability_mods, prof_bonus)
+        proficient_saves = self._proficiencies("saving_throws", ABILITY_ORDER)
+        proficient_skills = self._proficiencies("skills", SKILL_ORDER)
+        saves_html = self._render_saves(ability_mods, prof_bonus, proficient_saves)
+        skills_html = self._render_skills(ability_mods, prof_bonus, proficient_skills)
 
         # Passive perception
-        passive = self._calculate_passive_perception(ability_mods, prof_bonus)
+        passive = self._calculate_passive_perception(ability_mods, prof_bonus, proficient_skills)
 
         # Proficiencies
         prof_lang_html = render_content({
@@ -301,6 +378,7 @@ class StatsPage(PageBuilder):
 
         # Inspiration
         inspiration = "X" if self.data.get("inspiration") else ""
+        prof_bonus_display = self._prof_bonus_display()
 
         return f'''
             <!-- LEFT COLUMN -->
@@ -315,7 +393,7 @@ class StatsPage(PageBuilder):
                             <div class="stat-label">Inspiration</div>
                         </div>
                         <div class="box stat-row">
-                            <div class="stat-circle">+{prof_bonus}</div>
+                            <div class="stat-circle">{prof_bonus_display}</div>
                             <div class="stat-label">Proficiency Bonus</div>
                         </div>
                         <div class="box box--label-top saves-skills-box">
@@ -341,6 +419,22 @@ class StatsPage(PageBuilder):
         dex_mod = ability_mods.get("dexterity", 0)
         initiative = combat.get("initiative") or self._format_modifier(dex_mod)
 
+        # Armor class, initiative, speed
+        combat_html = render_content({
+            "type": "combat_stats",
+            "stats": [
+                {"label": "Armor Class", "value": combat.get("armor_class", "")},
+                {"label": "Initiative", "value": initiative},
+                {"label": "Speed", "value": combat.get("speed", "")},
+            ]
+        })
+
+        # Hit dice and death saves
+        hit_dice_html = render_content({
+            "type": "hit_dice_death",
+            "hit_dice": combat.get("hit_dice", {})
+        })
+
         # Attacks
         attacks_html = render_content({
             "type": "attacks",
@@ -364,20 +458,7 @@ class StatsPage(PageBuilder):
         return f'''
             <!-- MIDDLE COLUMN -->
             <div class="column">
-                <div class="combat-row">
-                    <div class="box box--label-bottom combat-stat">
-                        <div class="combat-value value--xlarge">{combat.get("armor_class", "")}</div>
-                        <div class="box__label">Armor Class</div>
-                    </div>
-                    <div class="box box--label-bottom combat-stat">
-                        <div class="combat-value value--xlarge">{initiative}</div>
-                        <div class="box__label">Initiative</div>
-                    </div>
-                    <div class="box box--label-bottom combat-stat">
-                        <div class="combat-value value--xlarge">{combat.get("speed", "")}</div>
-                        <div class="box__label">Speed</div>
-                    </div>
-                </div>
+                {combat_html}
                 <div class="box box--label-bottom hp-section">
                     <div class="hp-max-row">
                         <div class="hp-max-label">Hit Point Maximum</div>
@@ -389,33 +470,7 @@ class StatsPage(PageBuilder):
                 <div class="box box--label-bottom hp-temp">
                     <div class="hp-temp-value">{combat.get("hp_temporary") or ""}</div>
                     <div class="box__label">Temporary Hit Points</div>
-                </div>
-                <div class="hitdice-death-row">
-                    <div class="box box--label-bottom hitdice-box">
-                        <div class="hitdice-total">Total: {combat.get("hit_dice", {}).get("total", "")}</div>
-                        <div class="hitdice-value">{combat.get("hit_dice", {}).get("current") or ""}</div>
-                        <div class="box__label">Hit Dice</div>
-                    </div>
-                    <div class="box box--label-bottom death-box">
-                        <div class="death-row">
-                            <div class="death-label">Successes</div>
-                            <div class="death-circles">
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                            </div>
-                        </div>
-                        <div class="death-row">
-                            <div class="death-label">Failures</div>
-                            <div class="death-circles">
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                                <div class="death-circle"></div>
-                            </div>
-                        </div>
-                        <div class="box__label">Death Saves</div>
-                    </div>
-                </div>
+                </div>{hit_dice_html}
                 <div class="box box--label-top attacks-box">
                     <div class="box__label">Attacks & Spellcasting</div>
                     <div class="attack-header">
@@ -439,29 +494,17 @@ class StatsPage(PageBuilder):
             "class": "styled-list"
         })
 
+        # Personality trait boxes, then features in the same box style
+        trait_boxes = [
+            {"type": "trait_box", "label": label, "text": escape_text(personality.get(key, ""))}
+            for key, label in self.PERSONALITY_FIELDS
+        ]
+        trait_boxes.append({"type": "trait_box", "label": "Features & Traits", "text": features_html})
+        traits_html = "".join(map(render_content, trait_boxes))
+
         return f'''
             <!-- RIGHT COLUMN -->
-            <div class="column">
-                <div class="box box--label-bottom trait-box">
-                    <div class="trait-content">{personality.get("traits", "")}</div>
-                    <div class="box__label">Personality Traits</div>
-                </div>
-                <div class="box box--label-bottom trait-box">
-                    <div class="trait-content">{personality.get("ideals", "")}</div>
-                    <div class="box__label">Ideals</div>
-                </div>
-                <div class="box box--label-bottom trait-box">
-                    <div class="trait-content">{personality.get("bonds", "")}</div>
-                    <div class="box__label">Bonds</div>
-                </div>
-                <div class="box box--label-bottom trait-box">
-                    <div class="trait-content">{personality.get("flaws", "")}</div>
-                    <div class="box__label">Flaws</div>
-                </div>
-                <div class="box box--label-bottom trait-box">
-                    <div class="trait-content">{features_html}</div>
-                    <div class="box__label">Features & Traits</div>
-                </div>
+            <div class="column">{traits_html}
                 <div class="box box--label-top notes-box box--flex">
                     <div class="box__label">Notes</div>
                     <div class="notes-lines"></div>
@@ -470,16 +513,13 @@ class StatsPage(PageBuilder):
 
     def _render_abilities(self, abilities: dict, ability_mods: dict) -> str:
         """Render ability score boxes."""
-        ability_order = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
+        # Modifiers were computed once per sheet; only the scores are read here
         abilities_list = []
-        for ability in ability_order:
-            data = abilities.get(ability, {"score": 10})
-            score = data.get("score", 10)
-            mod = (score - 10) // 2
+        for ability in ABILITY_ORDER:
             abilities_list.append({
-                "name": ability[:3].upper(),
-                "score": score,
-                "modifier": self._format_modifier(mod)
+                "name": ABILITY_LABELS[ability],
+                "score": abilities.get(ability, {}).get("score", 10),
+                "modifier": self._format_modifier(ability_mods.get(ability, 0))
             })
 
         return render_content({
@@ -487,20 +527,25 @@ class StatsPage(PageBuilder):
             "abilities": abilities_list
         })
 
-    def _render_saves(self, ability_mods: dict, prof_bonus: int) -> str:
+    def _proficiencies(self, section: str, names: tuple[str, ...]) -> set[str]:
+        """Names marked proficient in a saving_throws/skills section (other keys are ignored)."""
+        entries = self.data.get(section, {})
+        return {
+            name for name in names
+            if entries.get(name, {}).get("proficient")
+        }
+
+    def _render_saves(self, ability_mods: dict, prof_bonus: int, proficient: set[str]) -> str:
         """Render saving throw rows."""
-        saves_data = self.data.get("saving_throws", {})
-        ability_order = ["strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma"]
         saves_list = []
 
-        for ability in ability_order:
-            save = saves_data.get(ability, {"proficient": False})
-            is_prof = save.get("proficient", False)
+        for ability in ABILITY_ORDER:
+            is_prof = ability in proficient
             mod = ability_mods.get(ability, 0)
             if is_prof:
                 mod += prof_bonus
             saves_list.append({
-                "name": ability.capitalize(),
+                "name": ABILITY_NAMES[ability],
                 "proficient": is_prof,
                 "modifier": self._format_modifier(mod)
             })
@@ -510,47 +555,18 @@ class StatsPage(PageBuilder):
             "saves": saves_list
         })
 
-    def _render_skills(self, ability_mods: dict, prof_bonus: int) -> str:
+    def _render_skills(self, ability_mods: dict, prof_bonus: int, proficient: set[str]) -> str:
         """Render skill rows."""
-        skill_abilities = {
-            "acrobatics": ("Dex", "dexterity"),
-            "animal_handling": ("Wis", "wisdom"),
-            "arcana": ("Int", "intelligence"),
-            "athletics": ("Str", "strength"),
-            "deception": ("Cha", "charisma"),
-            "history": ("Int", "intelligence"),
-            "insight": ("Wis", "wisdom"),
-            "intimidation": ("Cha", "charisma"),
-            "investigation": ("Int", "intelligence"),
-            "medicine": ("Wis", "wisdom"),
-            "nature": ("Int", "intelligence"),
-            "perception": ("Wis", "wisdom"),
-            "performance": ("Cha", "charisma"),
-            "persuasion": ("Cha", "charisma"),
-            "religion": ("Int", "intelligence"),
-            "sleight_of_hand": ("Dex", "dexterity"),
-            "stealth": ("Dex", "dexterity"),
-            "survival": ("Wis", "wisdom"),
-        }
-        skill_order = [
-            "acrobatics", "animal_handling", "arcana", "athletics", "deception",
-            "history", "insight", "intimidation", "investigation", "medicine",
-            "nature", "perception", "performance", "persuasion", "religion",
-            "sleight_of_hand", "stealth", "survival"
-        ]
-
-        skills_data = self.data.get("skills", {})
         skills_list = []
 
-        for skill in skill_order:
-            skill_info = skills_data.get(skill, {"proficient": False})
-            is_prof = skill_info.get("proficient", False)
-            ability_abbr, ability_name = skill_abilities.get(skill, ("???", "strength"))
+        for skill in SKILL_ORDER:
+            is_prof = skill in proficient
+            ability_abbr, ability_name = SKILL_ABILITIES.get(skill, ("???", "strength"))
             mod = ability_mods.get(ability_name, 0)
             if is_prof:
                 mod += prof_bonus
             skills_list.append({
-                "name": skill.replace("_", " ").title(),
+                "name": SKILL_NAMES[skill],
                 "ability": ability_abbr,
                 "proficient": is_prof,
                 "modifier": self._format_modifier(mod)
@@ -561,18 +577,17 @@ class StatsPage(PageBuilder):
             "skills": skills_list
         })
 
-    def _calculate_passive_perception(self, ability_mods: dict, prof_bonus: int) -> int:
+    def _calculate_passive_perception(self, ability_mods: dict, prof_bonus: int,
+                                      proficient_skills: set[str]) -> int:
         """Calculate passive perception."""
-        skills_data = self.data.get("skills", {})
-        perception = skills_data.get("perception", {"proficient": False})
         mod = ability_mods.get("wisdom", 0)
-        if perception.get("proficient", False):
+        if "perception" in proficient_skills:
             mod += prof_bonus
         return 10 + mod
 
     def _format_modifier(self, value: int) -> str:
         """Format modifier with +/- sign."""
-        return f"+{value}" if value >= 0 else str(value)
+        return ContentRenderer.format_modifier(value)
 
 
 # =============================================================================
@@ -592,6 +607,16 @@ class BackgroundPage(PageBuilder):
     - Notes section
     """
 
+    # Header appearance fields: (appearance key, label)
+    APPEARANCE_FIELDS = (
+        ("age", "Age"),
+        ("height", "Height"),
+        ("weight", "Weight"),
+        ("eyes", "Eyes"),
+        ("skin", "Skin"),
+        ("hair", "Hair"),
+    )
+
     def build(self) -> str:
         """Build the background page."""
         header = self.context.get("header", {})
@@ -626,53 +651,21 @@ class BackgroundPage(PageBuilder):
 
     def _build_page_header(self, header: dict, appearance: dict) -> str:
         """Build the page 2 header with appearance fields."""
-        return f'''
-        <div class="page-header">
-            <div class="header-left">
-                <div class="header-brand">Dungeons & Dragons</div>
-                <div class="box box--label-bottom header-name">
-                    <div class="value--large">{header.get("character_name", "")}</div>
-                    <div class="box__label">Character Name</div>
-                </div>
-            </div>
-            <div class="header-right">
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("age", "")}</div>
-                    <div class="box__label">Age</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("height", "")}</div>
-                    <div class="box__label">Height</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("weight", "")}</div>
-                    <div class="box__label">Weight</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("eyes", "")}</div>
-                    <div class="box__label">Eyes</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("skin", "")}</div>
-                    <div class="box__label">Skin</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{appearance.get("hair", "")}</div>
-                    <div class="box__label">Hair</div>
-                </div>
-            </div>
-        </div>'''
+        return self._page_header(
+            self._name_box(header.get("character_name", ""), "Character Name"),
+            self._info_fields(appearance, self.APPEARANCE_FIELDS)
+        )
 
     def _build_left_column(self, appearance: dict) -> str:
         """Build left column with appearance and backstory."""
         appearance_html = render_content({
             "type": "paragraphs",
-            "text": self.data.get("character_appearance_description", ""),
+            "text": escape_text(self.data.get("character_appearance_description", "")),
             "class": "text-content"
         })
         backstory_html = render_content({
             "type": "paragraphs",
-            "text": self.data.get("backstory", ""),
+            "text": escape_text(self.data.get("backstory", "")),
             "class": "text-content"
         })
 
@@ -692,7 +685,7 @@ class BackgroundPage(PageBuilder):
         """Build right column with allies, features, treasure."""
         allies_html = render_content({
             "type": "paragraphs",
-            "text": allies.get("description", ""),
+            "text": escape_text(allies.get("description", "")),
             "class": "text-content"
         })
         additional_features = render_content({
@@ -708,7 +701,7 @@ class BackgroundPage(PageBuilder):
                 <div class="column">
                     <div class="box box--label-top large-box" style="min-height: 60mm;">
                         <div class="box__label">Allies & Organizations</div>
-                        <div style="font-weight: 600; margin-bottom: 2mm;">{allies.get("name", "")}</div>
+                        <div style="font-weight: 600; margin-bottom: 2mm;">{escape_text(allies.get("name", ""))}</div>
                         <div class="large-box-content">{allies_html}</div>
                     </div>
                     <div class="box box--label-top large-box">
@@ -738,6 +731,24 @@ class SpellcastingPage(PageBuilder):
     - Notes sections
     """
 
+    # Header info fields: (spellcasting key, label)
+    HEADER_FIELDS = (
+        ("ability", "Spellcasting Ability"),
+        ("spell_save_dc", "Spell Save DC"),
+        ("spell_attack_bonus", "Spell Attack Bonus"),
+    )
+
+    # Cantrips have no prepared marker, just the name
+    CANTRIP_ITEM = '<div class="spell-item"><span>{}</span></div>'.format
+
+    # Blank notes box; two of them fill out the end of the spell grid
+    NOTES_BOX = '''
+            <div class="box spell-level-box notes-box">
+                <div class="box__label" style="font-size: 6.5pt; font-weight: 700; text-transform: uppercase; color: var(--accent-primary);">Notes</div>
+                <div class="notes-lines"></div>
+            </div>'''
+    NOTES_BOXES = NOTES_BOX * 2
+
     def build(self) -> str:
         """Build the spellcasting page."""
         spellcasting = self.data.get("spellcasting", {})
@@ -750,18 +761,18 @@ class SpellcastingPage(PageBuilder):
         cantrips_html = self._build_cantrips(spellcasting.get("cantrips", []))
 
         # Build spell levels
-        spell_levels_html = ""
+        spell_levels = []
         for level in range(1, 10):
-            level_str = str(level)
-            level_data = spells_data.get(level_str, {"slots_total": 0, "slots_expended": 0, "known": []})
-            spell_levels_html += render_content({
+            level_data = spells_data.get(str(level), {})
+            spell_levels.append(render_content({
                 "type": "spell_level",
                 "level": level,
                 "slots_total": level_data.get("slots_total", 0),
                 "slots_expended": level_data.get("slots_expended", 0),
                 "spells": level_data.get("known", []),
                 "min_rows": 8
-            })
+            }))
+        spell_levels_html = "".join(spell_levels)
 
         return f'''
     <!-- PAGE 3: Spellcasting -->
@@ -770,58 +781,19 @@ class SpellcastingPage(PageBuilder):
 
         <div class="spell-grid">
             {cantrips_html}
-            {spell_levels_html}
-            <div class="box spell-level-box notes-box">
-                <div class="box__label" style="font-size: 6.5pt; font-weight: 700; text-transform: uppercase; color: var(--accent-primary);">Notes</div>
-                <div class="notes-lines"></div>
-            </div>
-            <div class="box spell-level-box notes-box">
-                <div class="box__label" style="font-size: 6.5pt; font-weight: 700; text-transform: uppercase; color: var(--accent-primary);">Notes</div>
-                <div class="notes-lines"></div>
-            </div>
+            {spell_levels_html}{self.NOTES_BOXES}
         </div>
     </div>'''
 
     def _build_page_header(self, spellcasting: dict) -> str:
         """Build the spellcasting page header."""
-        return f'''
-        <div class="page-header">
-            <div class="header-left">
-                <div class="header-brand">Dungeons & Dragons</div>
-                <div class="box box--label-bottom header-name">
-                    <div class="value--large">{spellcasting.get("class", "")}</div>
-                    <div class="box__label">Spellcasting Class</div>
-                </div>
-            </div>
-            <div class="header-right" style="grid-template-columns: repeat(3, 1fr); grid-template-rows: 1fr;">
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{spellcasting.get("ability", "")}</div>
-                    <div class="box__label">Spellcasting Ability</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{spellcasting.get("spell_save_dc", "")}</div>
-                    <div class="box__label">Spell Save DC</div>
-                </div>
-                <div class="box box--label-bottom box--centered info-field">
-                    <div class="value--medium">{spellcasting.get("spell_attack_bonus", "")}</div>
-                    <div class="box__label">Spell Attack Bonus</div>
-                </div>
-            </div>
-        </div>'''
+        return self._page_header(
+            self._name_box(spellcasting.get("class", ""), "Spellcasting Class"),
+            self._info_fields(spellcasting, self.HEADER_FIELDS),
+            self.THREE_FIELD_STYLE
+        )
 
     def _build_cantrips(self, cantrips: list) -> str:
         """Build the cantrips box."""
-        cantrips_html = "".join([
-            f'<div class="spell-item"><span>{c}</span></div>'
-            for c in cantrips
-        ])
-
-        return f'''
-            <div class="box spell-level-box cantrip-box">
-                <div class="spell-level-header">
-                    <div class="spell-level-num">0</div>
-                    <div style="font-size: 6.5pt; font-weight: 700; text-transform: uppercase;">Cantrips</div>
-                </div>
-                <div class="spell-list">{cantrips_html}
-                </div>
-            </div>'''
+        cantrips_html = "".join(map(self.CANTRIP_ITEM, cantrips))
+        return SpellLevelRenderer.CANTRIP_TEMPLATE.format(spells=cantrips_html)
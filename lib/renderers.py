@@ -10,6 +10,50 @@ from abc import ABC, abstractmethod
 from typing import Any, Optional
 
 
+# Inline markdown patterns, compiled once at import
+BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
+ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
+
+
+def _signed(value: int) -> str:
+    return f"+{value}" if value >= 0 else str(value)
+
+
+# Signed modifier strings ("+3", "-1") for every value a sheet can produce
+MODIFIER_STRINGS = {value: _signed(value) for value in range(-10, 21)}
+
+# Ability score -> modifier for the full 0-30 score range
+ABILITY_MODIFIERS = {score: (score - 10) // 2 for score in range(0, 31)}
+
+# Bound formatter for list items, for use with map() when joining lists
+LIST_ITEM = "<li>{}</li>".format
+
+# Characters that must be escaped in HTML text and double-quoted attributes
+HTML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    '"': "&quot;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+
+
+def escape_attr(value: Any) -> str:
+    """Escape a value for use inside a double-quoted HTML attribute."""
+    return str(value).translate(HTML_ESCAPES)
+
+
+def escape_text(value: Any) -> str:
+    """Escape character-authored free text; markdown is converted afterwards."""
+    return str(value).translate(HTML_ESCAPES)
+
+
+class BlankDefaults(dict):
+    """Template mapping that fills any missing field with an empty string."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
 # =============================================================================
 # BASE RENDERER
 # =============================================================================
@@ -27,17 +71,28 @@ class ContentRenderer(ABC):
     @staticmethod
     def markdown_bold(text: str) -> str:
         """Convert **bold** markdown to <strong> tags."""
-        return re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', text)
+        return BOLD_PATTERN.sub(r'<strong>\1</strong>', text)
 
     @staticmethod
     def markdown_italic(text: str) -> str:
         """Convert *italic* markdown to <em> tags."""
-        return re.sub(r'\*([^*]+)\*', r'<em>\1</em>', text)
+        return ITALIC_PATTERN.sub(r'<em>\1</em>', text)
+
+    @staticmethod
+    def ability_modifier(score: int) -> int:
+        """Get the modifier for an ability score."""
+        modifier = ABILITY_MODIFIERS.get(score)
+        if modifier is None:
+            modifier = (score - 10) // 2
+        return modifier
 
     @staticmethod
     def format_modifier(value: int) -> str:
         """Format a modifier value with +/- sign."""
-        return f"+{value}" if value >= 0 else str(value)
+        modifier = MODIFIER_STRINGS.get(value)
+        if modifier is None:
+            modifier = _signed(value)
+        return modifier
 
 
 # =============================================================================
@@ -102,10 +157,7 @@ class BulletsRenderer(ContentRenderer):
         items = content.get("items", [])
         css_class = content.get("class", "ability-bullets")
 
-        bullets_html = "".join([
-            f'<li>{self.markdown_bold(item)}</li>'
-            for item in items
-        ])
+        bullets_html = "".join(map(LIST_ITEM, map(self.markdown_bold, items)))
         return f'<ul class="{css_class}">{bullets_html}</ul>'
 
 
@@ -121,7 +173,7 @@ class StyledListRenderer(ContentRenderer):
         if not items:
             return f'<ul class="{css_class}"></ul>'
 
-        list_items = "".join([f"<li>{item}</li>" for item in items])
+        list_items = "".join(map(LIST_ITEM, items))
         return f'<ul class="{css_class}">{list_items}</ul>'
 
 
@@ -166,6 +218,10 @@ class TableRenderer(ContentRenderer):
 
     content_type = "table"
 
+    # Bound cell formatters, for use with map()
+    HEADER_CELL = "<th>{}</th>".format
+    CELL = "<td>{}</td>".format
+
     def render(self, content: dict, context: Optional[dict] = None) -> str:
         columns = content.get("columns", [])
         rows = content.get("rows", [])
@@ -173,14 +229,14 @@ class TableRenderer(ContentRenderer):
         css_class = content.get("class", "scaling-table")
 
         # Build header
-        header_cells = "".join([f'<th>{col}</th>' for col in columns])
+        header_cells = "".join(map(self.HEADER_CELL, columns))
         header_html = f'<thead><tr>{header_cells}</tr></thead>'
 
         # Build rows
-        rows_html = ""
-        for row in rows:
-            cells = "".join([f'<td>{cell}</td>' for cell in row])
-            rows_html += f'<tr>{cells}</tr>'
+        rows_html = "".join([
+            f'<tr>{"".join(map(self.CELL, row))}</tr>'
+            for row in rows
+        ])
         body_html = f'<tbody>{rows_html}</tbody>'
 
         # Build footer if present
@@ -283,26 +339,21 @@ class SubsectionsRenderer(ContentRenderer):
 
     content_type = "subsections"
 
-    def render(self, content: dict, context: Optional[dict] = None) -> str:
-        items = content.get("items", [])
-        html = ""
-
-        for item in items:
-            name = item.get("name", "")
-            bullets = item.get("bullets", [])
-
-            bullets_html = "".join([
-                f'<li>{self.markdown_bold(bullet)}</li>'
-                for bullet in bullets
-            ])
-
-            html += f'''
+    TEMPLATE = '''
                     <div class="ability-block">
                         <div class="ability-name">{name}</div>
-                        <ul class="ability-bullets">{bullets_html}</ul>
+                        <ul class="ability-bullets">{bullets}</ul>
                     </div>'''
 
-        return html
+    def render(self, content: dict, context: Optional[dict] = None) -> str:
+        items = content.get("items", [])
+        return "".join([
+            self.TEMPLATE.format(
+                name=item.get("name", ""),
+                bullets="".join(map(LIST_ITEM, map(self.markdown_bold, item.get("bullets", []))))
+            )
+            for item in items
+        ])
 
 
 # =============================================================================
@@ -314,41 +365,41 @@ class SynergyRenderer(ContentRenderer):
 
     content_type = "synergy"
 
+    HEADER_TEMPLATE = '''
+                    <div class="synergy-header">
+                        <div class="synergy-icon">{icon}</div>
+                        <div>
+                            <div class="synergy-title">{title}</div>
+                            <div class="synergy-subtitle">{subtitle}</div>
+                        </div>
+                    </div>'''
+
+    SUBSECTION_TEMPLATE = '''
+                    <div class="ability-block" style="margin-top: 2mm;">
+                        <div class="ability-name">{name}</div>
+                        <ul class="ability-bullets">{bullets}</ul>
+                    </div>'''
+
     def render(self, content: dict, context: Optional[dict] = None) -> str:
         header = content.get("header", {})
         comparisons = content.get("comparisons", [])
         subsections = content.get("subsections", [])
 
-        # Build header
-        header_html = f'''
-                    <div class="synergy-header">
-                        <div class="synergy-icon">{header.get("icon", "")}</div>
-                        <div>
-                            <div class="synergy-title">{header.get("title", "")}</div>
-                            <div class="synergy-subtitle">{header.get("subtitle", "")}</div>
-                        </div>
-                    </div>'''
+        # Build header (missing fields render blank)
+        header_html = self.HEADER_TEMPLATE.format_map(BlankDefaults(header))
 
         # Build comparisons using ComparisonRenderer
         comp_renderer = ComparisonRenderer()
         comparisons_html = comp_renderer.render({"items": comparisons})
 
         # Build subsections
-        subsections_html = ""
-        for item in subsections:
-            name = item.get("name", "")
-            bullets = item.get("bullets", [])
-
-            bullets_html = "".join([
-                f'<li>{self.markdown_bold(bullet)}</li>'
-                for bullet in bullets
-            ])
-
-            subsections_html += f'''
-                    <div class="ability-block" style="margin-top: 2mm;">
-                        <div class="ability-name">{name}</div>
-                        <ul class="ability-bullets">{bullets_html}</ul>
-                    </div>'''
+        subsections_html = "".join([
+            self.SUBSECTION_TEMPLATE.format(
+                name=item.get("name", ""),
+                bullets="".join(map(LIST_ITEM, map(self.markdown_bold, item.get("bullets", []))))
+            )
+            for item in subsections
+        ])
 
         return f'{header_html}{comparisons_html}{subsections_html}'
 
@@ -364,13 +415,10 @@ class MixedRenderer(ContentRenderer):
 
     def render(self, content: dict, context: Optional[dict] = None) -> str:
         blocks = content.get("blocks", [])
-        html = ""
-
-        for block in blocks:
-            renderer = get_renderer(block.get("type", "text"))
-            html += renderer.render(block, context)
-
-        return html
+        return "".join([
+            get_renderer(block.get("type", "text")).render(block, context)
+            for block in blocks
+        ])
 
 
 # =============================================================================